@@ -8,13 +8,13 @@ Classes:
     AsyncAPIClient: Asynchronous client for interacting with the API.
 """
 
-import json
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple, Type, TypeVar
 from urllib.parse import urljoin
 
 import aiohttp
 import requests
+from pydantic import BaseModel
 
 from wandbot.api.routers.chat import APIQueryRequest, APIQueryResponse
 from wandbot.api.routers.database import (
@@ -31,6 +31,12 @@ from wandbot.api.routers.retrieve import (
 )
 from wandbot.database.schemas import QuestionAnswer
 
+# request bodies are serialized by pydantic directly, without a round trip
+# through python objects and the json module
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
 
 class APIClient:
     """Client for interacting with the API.
@@ -118,7 +124,8 @@ class APIClient:
         with requests.Session() as session:
             with session.post(
                 self.chat_question_answer_endpoint,
-                json=json.loads(request.model_dump_json()),
+                data=request.model_dump_json().encode("utf-8"),
+                headers=JSON_HEADERS,
             ) as response:
                 if response.status_code == 201:
                     return APIQuestionAnswerResponse(**response.json())
@@ -238,8 +245,11 @@ class APIClient:
             The response from the API, or None if the status code is not 200.
         """
         with requests.Session() as session:
-            payload = json.loads(request.model_dump_json())
-            with session.post(self.query_endpoint, json=payload) as response:
+            with session.post(
+                self.query_endpoint,
+                data=request.model_dump_json().encode("utf-8"),
+                headers=JSON_HEADERS,
+            ) as response:
                 if response.status_code == 200:
                     return APIQueryResponse(**response.json())
                 else:
@@ -283,8 +293,11 @@ class APIClient:
             The response from the API. None if the status code is not 200.
         """
         with requests.Session() as session:
-            payload = json.loads(request.model_dump_json())
-            with session.post(self.retrieve_endpoint, json=payload) as response:
+            with session.post(
+                self.retrieve_endpoint,
+                data=request.model_dump_json().encode("utf-8"),
+                headers=JSON_HEADERS,
+            ) as response:
                 if response.status_code == 200:
                     return APIRetrievalResponse(**response.json())
                 else:
@@ -323,13 +336,70 @@ class AsyncAPIClient(APIClient):
     and querying. All methods are asynchronous.
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, session: aiohttp.ClientSession | None = None):
         """Initializes the AsyncAPIClient instance with a given URL.
 
         Args:
             url: The URL of the API to interact with.
+            session: An optional client session to reuse for all requests.
         """
         super().__init__(url)
+        self._session = session
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The client session shared by all requests.
+
+        The session is created lazily so that it is bound to the running event
+        loop, and it keeps connections alive across requests.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=30,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the shared client session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        response_model: Type[ResponseModel],
+        ok_statuses: Tuple[int, ...],
+        request: BaseModel | None = None,
+    ) -> ResponseModel | None:
+        """Private method to send a request to the API and parse the response.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The URL to send the request to.
+            response_model: The model to parse the response body into.
+            ok_statuses: The status codes of a successful response.
+            request: The request object to send as the JSON body, if any.
+
+        Returns:
+            The parsed response, or None if the status code is not in
+            `ok_statuses`.
+        """
+        kwargs = {}
+        if request is not None:
+            kwargs = {
+                "data": request.model_dump_json(),
+                "headers": JSON_HEADERS,
+            }
+        async with self.session.request(method, url, **kwargs) as response:
+            if response.status in ok_statuses:
+                return response_model(**await response.json())
+            return None
 
     async def _get_chat_thread(
         self, request: APIGetChatThreadRequest
@@ -342,13 +412,12 @@ class AsyncAPIClient(APIClient):
         Returns:
             The response from the API, or None if the status code is not 200 or 201.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.chat_thread_endpoint}/{request.application}/{request.thread_id}"
-            ) as response:
-                if response.status in (200, 201):
-                    response = await response.json()
-                    return APIGetChatThreadResponse(**response)
+        return await self._request(
+            "GET",
+            f"{self.chat_thread_endpoint}/{request.application}/{request.thread_id}",
+            APIGetChatThreadResponse,
+            ok_statuses=(200, 201),
+        )
 
     async def get_chat_history(
         self, application: str, thread_id: str
@@ -383,14 +452,13 @@ class AsyncAPIClient(APIClient):
         Returns:
             The response from the API, or None if the status code is not 201.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.chat_question_answer_endpoint,
-                json=json.loads(request.model_dump_json()),
-            ) as response:
-                if response.status == 201:
-                    response = await response.json()
-                    return APIQuestionAnswerResponse(**response)
+        return await self._request(
+            "POST",
+            self.chat_question_answer_endpoint,
+            APIQuestionAnswerResponse,
+            ok_statuses=(201,),
+            request=request,
+        )
 
     async def create_question_answer(
         self,
@@ -469,14 +537,13 @@ class AsyncAPIClient(APIClient):
         Returns:
             The response from the API.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.feedback_endpoint,
-                json=json.loads(request.model_dump_json()),
-            ) as response:
-                if response.status == 201:
-                    response = await response.json()
-                    return APIFeedbackResponse(**response)
+        return await self._request(
+            "POST",
+            self.feedback_endpoint,
+            APIFeedbackResponse,
+            ok_statuses=(201,),
+            request=request,
+        )
 
     async def create_feedback(
         self, feedback_id: str, question_answer_id: str, rating: int
@@ -508,15 +575,13 @@ class AsyncAPIClient(APIClient):
         Returns:
             The response from the API, or None if the status code is not 200.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.query_endpoint, json=json.loads(request.model_dump_json())
-            ) as response:
-                if response.status == 200:
-                    response = await response.json()
-                    return APIQueryResponse(**response)
-                else:
-                    return None
+        return await self._request(
+            "POST",
+            self.query_endpoint,
+            APIQueryResponse,
+            ok_statuses=(200,),
+            request=request,
+        )
 
     async def query(
         self,
@@ -556,16 +621,13 @@ class AsyncAPIClient(APIClient):
         Returns:
             The response from the API. None if the status code is not 200.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.retrieve_endpoint,
-                json=json.loads(request.model_dump_json()),
-            ) as response:
-                if response.status == 200:
-                    response = await response.json()
-                    return APIRetrievalResponse(**response)
-                else:
-                    return None
+        return await self._request(
+            "POST",
+            self.retrieve_endpoint,
+            APIRetrievalResponse,
+            ok_statuses=(200,),
+            request=request,
+        )
 
     async def retrieve(
         self, query: str, language: str, initial_k: int = 50, top_k: int = 10
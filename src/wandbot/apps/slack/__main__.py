@@ -4,7 +4,8 @@ This module contains the main functionality of the Slack bot. It listens for men
 processes the text of the message, and sends a response. It also handles reactions added to messages and 
 saves them as feedback. The bot supports both English and Japanese languages.
 
-The bot uses the Slack Bolt framework for handling events and the langdetect library for language detection.
+The bot uses the Slack Bolt framework for handling events. The language of the bot is fixed by its config,
+so no language detection is performed on incoming messages.
 It also communicates with an external API for processing queries and storing chat history and feedback.
 
 """
@@ -12,11 +13,14 @@ It also communicates with an external API for processing queries and storing cha
 import argparse
 import asyncio
 import logging
-from functools import partial
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Dict, Set, Tuple
 
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from slack_bolt.async_app import AsyncApp
 from slack_sdk.web import SlackResponse
+from slack_sdk.web.async_client import AsyncWebClient
 
 from wandbot.api.client import AsyncAPIClient
 from wandbot.apps.slack.config import SlackAppEnConfig, SlackAppJaConfig
@@ -24,51 +28,85 @@ from wandbot.apps.slack.formatter import MrkdwnFormatter
 from wandbot.apps.utils import format_response
 from wandbot.utils import get_logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and not available on Windows
+    uvloop = None
+
 logger = get_logger(__name__)
 
-parser = argparse.ArgumentParser()
+# set by `main`, so that importing this module does not read the config
+config: SlackAppEnConfig | SlackAppJaConfig | None = None
+api_client: AsyncAPIClient | None = None
+# caps the number of concurrent queries to the wandbot API
+query_semaphore: asyncio.Semaphore | None = None
 
-parser.add_argument(
-    "-l",
-    "--language",
-    default="en",
-    help="Language of the bot",
-    type=str,
-    choices=["en", "ja"],
-)
+background_tasks: Set[asyncio.Task] = set()
 
-args = parser.parse_args()
+THREAD_TS_CACHE_SIZE = 1024
+thread_ts_cache: OrderedDict[Tuple[str, str], str] = OrderedDict()
+thread_ts_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
 
-if args.language == "ja":
-    config = SlackAppJaConfig()
-else:
-    config = SlackAppEnConfig()
+mrkdwn_formatter = MrkdwnFormatter()
 
 
-app = AsyncApp(token=config.SLACK_APP_TOKEN)
-api_client = AsyncAPIClient(url=config.WANDBOT_API_URL)
+@lru_cache(maxsize=256)
+def format_static_message(message: str) -> str:
+    """Formats messages built from fixed templates, e.g. the intro message."""
+    return mrkdwn_formatter(message)
 
 
 async def send_message(
-    say: callable, message: str, thread: str = None
+    say: callable, message: str, thread: str = None, static: bool = False
 ) -> SlackResponse:
-    message = MrkdwnFormatter()(message)
+    if static:
+        message = format_static_message(message)
+    else:
+        message = mrkdwn_formatter(message)
     if thread is not None:
         return await say(text=message, thread_ts=thread)
     else:
         return await say(text=message)
 
 
-@app.event("app_mention")
 async def command_handler(
-    body: dict, say: callable, logger: logging.Logger
+    ack: callable,
+    body: dict,
+    say: callable,
+    client: AsyncWebClient,
+    logger: logging.Logger,
 ) -> None:
     """
     Handles the command when the app is mentioned in a message.
 
+    The event is acknowledged right away and the query is processed in a
+    background task, so that slow API calls do not hold up the listener.
+
+    Args:
+        ack (function): The function to acknowledge the event.
+        body (dict): The event body containing the message details.
+        say (function): The function to send a message.
+        client (AsyncWebClient): The Slack web client.
+        logger (Logger): The logger instance for logging errors.
+    """
+    await ack()
+    task = asyncio.create_task(process_mention(body, say, client, logger))
+    # keep a reference to the task until it is done, so it is not garbage
+    # collected mid-execution
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+
+async def process_mention(
+    body: dict, say: callable, client: AsyncWebClient, logger: logging.Logger
+) -> None:
+    """
+    Processes the query from a message the app is mentioned in.
+
     Args:
         body (dict): The event body containing the message details.
         say (function): The function to send a message.
+        client (AsyncWebClient): The Slack web client.
         logger (Logger): The logger instance for logging errors.
 
     Raises:
@@ -82,9 +120,13 @@ async def command_handler(
         )
         say = partial(say, token=config.SLACK_BOT_TOKEN)
 
-        chat_history = await api_client.get_chat_history(
-            application=config.APPLICATION, thread_id=thread_id
-        )
+        # a mention outside of a thread starts a new one without history
+        if body["event"].get("thread_ts") is not None:
+            chat_history = await api_client.get_chat_history(
+                application=config.APPLICATION, thread_id=thread_id
+            )
+        else:
+            chat_history = None
 
         if not chat_history:
             # send out the intro message
@@ -92,14 +134,16 @@ async def command_handler(
                 say=say,
                 message=config.INTRO_MESSAGE.format(user=user),
                 thread=thread_id,
+                static=True,
             )
         # process the query through the api
-        api_response = await api_client.query(
-            question=query,
-            chat_history=chat_history,
-            language=config.bot_language,
-            application=config.APPLICATION,
-        )
+        async with query_semaphore:
+            api_response = await api_client.query(
+                question=query,
+                chat_history=chat_history,
+                language=config.bot_language,
+                application=config.APPLICATION,
+            )
         response = format_response(
             config,
             api_response,
@@ -111,31 +155,40 @@ async def command_handler(
             say=say, message=response, thread=thread_id
         )
 
-        await app.client.reactions_add(
-            channel=body["event"]["channel"],
-            timestamp=sent_message["ts"],
-            name="thumbsup",
-            token=config.SLACK_BOT_TOKEN,
-        )
-        await app.client.reactions_add(
-            channel=body["event"]["channel"],
-            timestamp=sent_message["ts"],
-            name="thumbsdown",
-            token=config.SLACK_BOT_TOKEN,
-        )
-
-        #  save the question answer to the database
-        await api_client.create_question_answer(
-            thread_id=thread_id,
-            question_answer_id=sent_message["ts"],
-            language=config.bot_language,
-            **api_response.model_dump(),
+        # add the feedback reactions and save the question answer to the
+        # database concurrently, these calls are independent of each other
+        results = await asyncio.gather(
+            client.reactions_add(
+                channel=body["event"]["channel"],
+                timestamp=sent_message["ts"],
+                name="thumbsup",
+                token=config.SLACK_BOT_TOKEN,
+            ),
+            client.reactions_add(
+                channel=body["event"]["channel"],
+                timestamp=sent_message["ts"],
+                name="thumbsdown",
+                token=config.SLACK_BOT_TOKEN,
+            ),
+            api_client.create_question_answer(
+                thread_id=thread_id,
+                question_answer_id=sent_message["ts"],
+                language=config.bot_language,
+                **api_response.model_dump(),
+            ),
+            return_exceptions=True,
         )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error finalizing message: {result}")
 
     except Exception as e:
         logger.error(f"Error posting message: {e}")
 
 
+REACTION_RATINGS = {"+1": 1, "-1": -1}
+
+
 def parse_reaction(reaction: str) -> int:
     """
     Parses the reaction and returns the corresponding rating value.
@@ -146,51 +199,142 @@ def parse_reaction(reaction: str) -> int:
     Returns:
         int: The rating value (-1, 0, or 1).
     """
-    if reaction == "+1":
-        return 1
-    elif reaction == "-1":
-        return -1
-    else:
-        return 0
+    return REACTION_RATINGS.get(reaction, 0)
+
+
+async def get_thread_ts(
+    client: AsyncWebClient, channel_id: str, message_ts: str
+) -> str | None:
+    """
+    Gets the thread timestamp of a message.
+
+    The thread of a message never changes once it is set, so the lookups are
+    cached per message, and concurrent lookups of the same message share a
+    single request.
 
+    Args:
+        client (AsyncWebClient): The Slack web client.
+        channel_id (str): The ID of the channel the message is in.
+        message_ts (str): The timestamp of the message.
+
+    Returns:
+        str | None: The thread timestamp, or None if the message is not in a
+            thread.
+    """
+    key = (channel_id, message_ts)
+    if key in thread_ts_cache:
+        thread_ts_cache.move_to_end(key)
+        return thread_ts_cache[key]
+
+    lock = thread_ts_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        if key in thread_ts_cache:
+            return thread_ts_cache[key]
+        try:
+            conversation = await client.conversations_replies(
+                channel=channel_id,
+                ts=message_ts,
+                inclusive=True,
+                limit=1,
+                token=config.SLACK_BOT_TOKEN,
+            )
+        finally:
+            thread_ts_locks.pop(key, None)
+        messages = conversation.get(
+            "messages",
+        )
+        thread_ts = None
+        if messages and len(messages):
+            thread_ts = messages[0].get("thread_ts")
+        # a message without a thread may still get one later
+        if thread_ts:
+            thread_ts_cache[key] = thread_ts
+            if len(thread_ts_cache) > THREAD_TS_CACHE_SIZE:
+                thread_ts_cache.popitem(last=False)
+        return thread_ts
 
-@app.event("reaction_added")
-async def handle_reaction_added(event: dict) -> None:
+
+async def handle_reaction_added(event: dict, client: AsyncWebClient) -> None:
     """
     Handles the event when a reaction is added to a message.
 
     Args:
         event (dict): The event details.
+        client (AsyncWebClient): The Slack web client.
 
     """
     channel_id = event["item"]["channel"]
     message_ts = event["item"]["ts"]
 
-    conversation = await app.client.conversations_replies(
-        channel=channel_id,
-        ts=message_ts,
-        inclusive=True,
-        limit=1,
-        token=config.SLACK_BOT_TOKEN,
+    thread_ts = await get_thread_ts(client, channel_id, message_ts)
+    if thread_ts:
+        rating = parse_reaction(event["reaction"])
+        await api_client.create_feedback(
+            feedback_id=event["event_ts"],
+            question_answer_id=message_ts,
+            rating=rating,
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-l",
+        "--language",
+        default="en",
+        help="Language of the bot",
+        type=str,
+        choices=["en", "ja"],
     )
-    messages = conversation.get(
-        "messages",
+    return parser.parse_args()
+
+
+def build_app(
+    language: str,
+) -> Tuple[AsyncApp, AsyncAPIClient, SlackAppEnConfig | SlackAppJaConfig]:
+    """
+    Builds the Slack app, the API client and the config for a language.
+
+    Must be called from within the running event loop, since the Slack web
+    client shares the connection pool of the API client's session.
+
+    Args:
+        language (str): The language of the bot, either "en" or "ja".
+
+    Returns:
+        tuple: The Slack app, the API client and the config.
+    """
+    if language == "ja":
+        config = SlackAppJaConfig()
+    else:
+        config = SlackAppEnConfig()
+
+    api_client = AsyncAPIClient(url=config.WANDBOT_API_URL)
+    # share one connection pool between the Slack and the wandbot API calls
+    app = AsyncApp(
+        client=AsyncWebClient(
+            token=config.SLACK_APP_TOKEN, session=api_client.session
+        )
     )
-    if messages and len(messages):
-        thread_ts = messages[0].get("thread_ts")
-        if thread_ts:
-            rating = parse_reaction(event["reaction"])
-            await api_client.create_feedback(
-                feedback_id=event["event_ts"],
-                question_answer_id=message_ts,
-                rating=rating,
-            )
+    app.event("app_mention")(command_handler)
+    app.event("reaction_added")(handle_reaction_added)
+    return app, api_client, config
+
 
+async def main(language: str = "en"):
+    global api_client, config, query_semaphore
 
-async def main():
+    app, api_client, config = build_app(language)
+    query_semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_QUERIES)
     handler = AsyncSocketModeHandler(app, config.SLACK_APP_TOKEN)
-    await handler.start_async()
+    try:
+        await handler.start_async()
+    finally:
+        await api_client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main(args.language))
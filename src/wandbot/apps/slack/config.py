@@ -67,6 +67,9 @@ class SlackAppEnConfig(BaseSettings):
     ERROR_MESSAGE: str = Field(EN_ERROR_MESSAGE)
     WARNING_MESSAGE: str = Field(EN_FALLBACK_WARNING_MESSAGE)
     WANDBOT_API_URL: AnyHttpUrl = Field(..., validation_alias="WANDBOT_API_URL")
+    MAX_CONCURRENT_QUERIES: int = Field(
+        16, validation_alias="WANDBOT_MAX_CONCURRENCY"
+    )
     include_sources: bool = True
     bot_language: str = "en"
 
@@ -87,6 +90,9 @@ class SlackAppJaConfig(BaseSettings):
     ERROR_MESSAGE: str = Field(JA_ERROR_MESSAGE)
     WARNING_MESSAGE: str = Field(JA_FALLBACK_WARNING_MESSAGE)
     WANDBOT_API_URL: AnyHttpUrl = Field(..., validation_alias="WANDBOT_API_URL")
+    MAX_CONCURRENT_QUERIES: int = Field(
+        16, validation_alias="WANDBOT_MAX_CONCURRENCY"
+    )
     include_sources: bool = True
     bot_language: str = "ja"
 
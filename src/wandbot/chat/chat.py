@@ -63,6 +63,8 @@ class Chat:
             job_type="chat",
         )
         self.run._label(repo="wandbot")
+        # shared by the translation calls so they reuse one connection pool
+        self.openai_client = OpenAI()
 
         self.rag_pipeline = RAGPipeline(
             vector_store=vector_store,
@@ -78,10 +80,11 @@ class Chat:
     def _get_answer(
         self, question: str, chat_history: List[QuestionAnswer]
     ) -> RAGPipelineOutput:
-        history = []
-        for item in chat_history:
-            history.append(("user", item.question))
-            history.append(("assistant", item.answer))
+        history = [
+            message
+            for item in chat_history
+            for message in (("user", item.question), ("assistant", item.answer))
+        ]
 
         result = self.rag_pipeline(question, history)
 
@@ -98,8 +101,7 @@ class Chat:
         Returns:
             The translated text in English.
         """
-        client = OpenAI()
-        response = client.chat.completions.create(
+        response = self.openai_client.chat.completions.create(
             model="gpt-4o-2024-08-06",
             messages=[
                 {
@@ -133,8 +135,7 @@ class Chat:
         Returns:
             The translated text in Japanese.
         """
-        client = OpenAI()
-        response = client.chat.completions.create(
+        response = self.openai_client.chat.completions.create(
                         model="gpt-4o-2024-08-06",
             messages=[
                 {
@@ -6,7 +6,6 @@ from typing import Any, Dict, List, Optional, Tuple
 import regex as re
 import weave
 from langchain_core.messages import convert_to_messages, get_buffer_string
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import (
     Runnable,
     RunnableLambda,
@@ -16,7 +15,7 @@ from langchain_core.runnables import (
 from langchain_openai import ChatOpenAI
 from pydantic.v1 import BaseModel, Field
 
-from wandbot.rag.utils import ChatModel
+from wandbot.rag.utils import ChatModel, load_chat_prompt
 from wandbot.utils import get_logger
 
 logger = get_logger(__name__)
@@ -268,7 +267,7 @@ class QueryEnhancer:
     ):
         self.model = {"model_name": model, "temperature": temperature}  # type: ignore
         self.fallback_model = {"model_name": fallback_model, "temperature": fallback_temperature}  # type: ignore
-        self.prompt = ChatPromptTemplate.from_messages(ENHANCER_PROMPT_MESSAGES)
+        self.prompt = load_chat_prompt(tuple(ENHANCER_PROMPT_MESSAGES))
         self._chain = None
 
     @property
@@ -3,11 +3,15 @@ from typing import Any, Dict
 
 import weave
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable, RunnableLambda, RunnableParallel
 from langchain_openai import ChatOpenAI
 
-from wandbot.rag.utils import ChatModel, combine_documents, create_query_str
+from wandbot.rag.utils import (
+    ChatModel,
+    combine_documents,
+    create_query_str,
+    load_chat_prompt,
+)
 
 RESPONSE_SYNTHESIS_SYSTEM_PROMPT = """You are Wandbot - a support expert in Weights & Biases, wandb and weave. 
 Your goal to help users with questions related to Weight & Biases, `wandb`, and the visualization library `weave`
@@ -126,8 +130,8 @@ class ResponseSynthesizer:
     ):
         self.model = {"model_name": model, "temperature": temperature}  # type: ignore
         self.fallback_model = {"model_name": fallback_model, "temperature": fallback_temperature}  # type: ignore
-        self.prompt = ChatPromptTemplate.from_messages(
-            RESPONSE_SYNTHESIS_PROMPT_MESSAGES
+        self.prompt = load_chat_prompt(
+            tuple(RESPONSE_SYNTHESIS_PROMPT_MESSAGES)
         )
         self._chain = None
 
@@ -1,13 +1,36 @@
+import functools
 import json
+from typing import Tuple
 
 from langchain_core.documents import Document
-from langchain_core.prompts import PromptTemplate, format_document
+from langchain_core.prompts import (
+    ChatPromptTemplate,
+    PromptTemplate,
+    format_document,
+)
+from langchain_core.prompts.chat import BaseStringMessagePromptTemplate
 from langchain_openai import ChatOpenAI
 
 from wandbot.retriever.web_search import YouSearchResults
 from wandbot.utils import clean_document_content
 
 
+@functools.lru_cache(maxsize=None)
+def load_chat_model(
+    model_name: str, temperature: float, max_retries: int
+) -> ChatOpenAI:
+    """Loads a chat model, shared by all components with the same settings.
+
+    Each ChatOpenAI instance holds its own API client and connection pool, so
+    identical models are created once instead of once per component.
+    """
+    return ChatOpenAI(
+        model_name=model_name,
+        temperature=temperature,
+        max_retries=max_retries,
+    )
+
+
 class ChatModel:
     def __init__(self, max_retries: int = 2):
         self.max_retries = max_retries
@@ -21,7 +44,7 @@ class ChatModel:
         return value
 
     def __set__(self, obj, value):
-        model = ChatOpenAI(
+        model = load_chat_model(
             model_name=value["model_name"],
             temperature=value["temperature"],
             max_retries=self.max_retries,
@@ -29,6 +52,32 @@ class ChatModel:
         setattr(obj, self.private_name, model)
 
 
+@functools.lru_cache(maxsize=64)
+def load_chat_prompt(
+    messages: Tuple[Tuple[str, str], ...]
+) -> ChatPromptTemplate:
+    """Builds a chat prompt template from (role, template) message pairs.
+
+    Prompt messages are static module-level constants, so the parsed template
+    is cached and shared instead of being re-parsed for every instance.
+    Messages without input variables, such as the system prompt and few-shot
+    examples, are rendered once, so that only the remaining messages are
+    formatted on each call.
+    """
+    prompt = ChatPromptTemplate.from_messages(list(messages))
+    return ChatPromptTemplate.from_messages(
+        [
+            (
+                message.format()
+                if isinstance(message, BaseStringMessagePromptTemplate)
+                and not message.input_variables
+                else message
+            )
+            for message in prompt.messages
+        ]
+    )
+
+
 DEFAULT_QUESTION_PROMPT = PromptTemplate.from_template(
     template="""# Query
 
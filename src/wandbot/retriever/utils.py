@@ -1,6 +1,21 @@
+import functools
+
 from langchain_openai import OpenAIEmbeddings
 
 
+@functools.lru_cache(maxsize=None)
+def load_embeddings_model(
+    model_name: str, tokenizer_model_name: str, dimensions: int
+) -> OpenAIEmbeddings:
+    """Loads an embeddings model, shared by all vector stores with the same
+    settings so that they reuse one API client and connection pool."""
+    return OpenAIEmbeddings(
+        model=model_name,
+        tiktoken_model_name=tokenizer_model_name,
+        dimensions=dimensions,
+    )
+
+
 class OpenAIEmbeddingsModel:
     def __init__(self):
         pass
@@ -14,9 +29,9 @@ class OpenAIEmbeddingsModel:
         return value
 
     def __set__(self, obj, value):
-        model = OpenAIEmbeddings(
-            model=value["embedding_model_name"],
-            tiktoken_model_name=value["tokenizer_model_name"],
+        model = load_embeddings_model(
+            model_name=value["embedding_model_name"],
+            tokenizer_model_name=value["tokenizer_model_name"],
             dimensions=value["embedding_dimensions"],
         )
         setattr(obj, self.private_name, model)
@@ -23,6 +23,7 @@ Typical usage example:
 
 import asyncio
 import datetime
+import functools
 import hashlib
 import json
 import logging
@@ -31,16 +32,20 @@ import pathlib
 import re
 import sqlite3
 import string
+import time
 from typing import Any, Coroutine, List, Tuple
 
-import fasttext
-import nest_asyncio
-import tiktoken
 from langchain_core.documents import Document
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-import wandb
+
+LOG_LEVEL = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO"))
+
+logging.basicConfig(
+    format="%(asctime)s : %(levelname)s : %(message)s",
+    level=LOG_LEVEL,
+)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -52,12 +57,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         A logger instance with the specified name.
     """
-    logging.basicConfig(
-        format="%(asctime)s : %(levelname)s : %(message)s",
-        level=logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO")),
-    )
-    logger = logging.getLogger(name)
-    return logger
+    return logging.getLogger(name)
 
 
 logger = get_logger(__name__)
@@ -77,8 +77,9 @@ class Timer:
 
     def __init__(self) -> None:
         """Initializes the timer."""
-        self.start = datetime.datetime.now().astimezone(datetime.timezone.utc)
-        self.stop = self.start
+        self.start = datetime.datetime.now(datetime.timezone.utc)
+        self._start_ns = time.perf_counter_ns()
+        self._stop_ns = self._start_ns
 
     def __enter__(self) -> "Timer":
         """Starts the timer."""
@@ -86,12 +87,17 @@ class Timer:
 
     def __exit__(self, *args: Any) -> None:
         """Stops the timer."""
-        self.stop = datetime.datetime.now().astimezone(datetime.timezone.utc)
+        self._stop_ns = time.perf_counter_ns()
+
+    @property
+    def stop(self) -> datetime.datetime:
+        """The wall-clock stop time, derived from the monotonic elapsed time."""
+        return self.start + datetime.timedelta(seconds=self.elapsed)
 
     @property
     def elapsed(self) -> float:
         """Calculates the elapsed time in seconds."""
-        return (self.stop - self.start).total_seconds()
+        return (self._stop_ns - self._start_ns) / 1e9
 
 
 def cachew(cache_path: str = "./cache.db", logger=None):
@@ -167,9 +173,11 @@ class FastTextLangDetect:
     https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin
     """
 
-    def __init__(self, config: FasttextModelConfig = FasttextModelConfig()):
-        self.config = config
-        self._model = self._load_model()
+    def __init__(self, config: FasttextModelConfig | None = None):
+        self.config = config if config is not None else FasttextModelConfig()
+        # the model is loaded on first use, callers that already know the
+        # language never pay for downloading and loading it
+        self._model = None
 
     def detect_language(self, text: str):
         cleaned_text = strip_punctuation(text).replace("\n", " ")
@@ -187,6 +195,10 @@ class FastTextLangDetect:
         return self._model
 
     def _load_model(self):
+        import fasttext
+
+        import wandb
+
         if not os.path.isfile(self.config.fasttext_file_path):
             if wandb.run is None:
                 api = wandb.Api()
@@ -209,6 +221,8 @@ def run_async_tasks(
     progress_bar_desc: str = "Running async tasks",
 ) -> Tuple[Any]:
     """Run a list of async tasks."""
+    import nest_asyncio
+
     tasks_to_execute: List[Any] = tasks
 
     nest_asyncio.apply()
@@ -251,33 +265,35 @@ def clean_document_content(doc: Document) -> Document:
     return cleaned_document
 
 
-def make_document_tokenization_safe(document: Document) -> Document:
-    """Removes special tokens from the given documents.
+@functools.lru_cache(maxsize=None)
+def _get_special_tokens_pattern(encoding_name: str) -> re.Pattern:
+    """Compiles a single alternation matching all special tokens of an encoding.
 
     Args:
-        documents: A list of strings representing the documents.
+        encoding_name: The name of the tiktoken encoding.
 
     Returns:
-        A list of cleaned documents with special tokens removed.
+        A compiled pattern matching any of the encoding's special tokens.
     """
-    encoding = tiktoken.get_encoding("cl100k_base")
-    special_tokens_set = encoding.special_tokens_set
+    import tiktoken
+
+    encoding = tiktoken.get_encoding(encoding_name)
+    # longest first so that tokens sharing a prefix are matched in full
+    special_tokens = sorted(encoding.special_tokens_set, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, special_tokens)))
 
-    def remove_special_tokens(text: str) -> str:
-        """Removes special tokens from the given text.
 
-        Args:
-            text: A string representing the text.
+def make_document_tokenization_safe(document: Document) -> Document:
+    """Removes special tokens from the given documents.
 
-        Returns:
-            The text with special tokens removed.
-        """
-        for token in special_tokens_set:
-            text = text.replace(token, "")
-        return text
+    Args:
+        documents: A list of strings representing the documents.
 
-    content = document.page_content
-    cleaned_document = remove_special_tokens(content)
+    Returns:
+        A list of cleaned documents with special tokens removed.
+    """
+    special_tokens_pattern = _get_special_tokens_pattern("cl100k_base")
+    cleaned_document = special_tokens_pattern.sub("", document.page_content)
     return Document(page_content=cleaned_document, metadata=document.metadata)
 
 